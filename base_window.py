@@ -110,6 +110,17 @@ class BaseWindow(tk.Toplevel, ABC):
         combo = ttk.Combobox(self.main_frame, values=values, width=width)
         combo.grid(row=row, column=column, padx=5, pady=5, sticky='w')
         return combo
+    
+    def poll_future(self, future, on_done, interval: int = 20):
+        """
+        Call on_done(future.result()) on the Tk thread once a background
+        future completes, polling with after() instead of blocking
+        """
+        if not future.done():
+            self.after(interval, self.poll_future, future, on_done, interval)
+            return
+        if self.winfo_exists():
+            on_done(future.result())
 
 class BaseFormWindow(BaseWindow):
     """
@@ -120,17 +131,21 @@ class BaseFormWindow(BaseWindow):
     
     def __init__(self, root, title: str, geometry: str = "600x400"):
         self.entries = {}
+        # (field_name, entry) pairs kept alongside entries for fast reads
+        self._entry_pairs = []
         super().__init__(root, title, geometry)
     
     def add_form_field(self, label: str, field_name: str, row: int):
         """Add a form field and store it in entries dictionary"""
-        self.entries[field_name] = self.create_form_field(label, row)
+        entry = self.create_form_field(label, row)
+        self.entries[field_name] = entry
+        self._entry_pairs.append((field_name, entry))
     
     def get_form_data(self) -> dict:
         """Get all form data as a dictionary"""
         return {
             field: entry.get().strip() 
-            for field, entry in self.entries.items()
+            for field, entry in self._entry_pairs
         }
     
     def clear_form(self):
@@ -147,6 +162,8 @@ class BaseTableWindow(BaseWindow):
     
     def __init__(self, root, title: str, columns: tuple, geometry: str = "800x600"):
         self.columns = columns
+        # (values, iid) for every row, so sorting needs no Tcl reads
+        self._rows = []
         super().__init__(root, title, geometry)
     
     def _create_widgets(self):
@@ -182,19 +199,34 @@ class BaseTableWindow(BaseWindow):
     
     def sort_by(self, column: str):
         """Sort table by column"""
-        items = [(self.tree.set(item, column), item) for item in self.tree.get_children('')]
-        items.sort()
-        for idx, (_, item) in enumerate(items):
-            self.tree.move(item, '', idx)
+        idx = self.columns.index(column)
+        # Compare as text, the way the Treeview stores cell values
+        self._rows.sort(key=lambda row: str(row[0][idx]))
+        move = self.tree.move
+        for position, (_, item) in enumerate(self._rows):
+            move(item, '', position)
     
     def clear_table(self):
         """Clear all items from table"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        children = self.tree.get_children()
+        if children:
+            # A single delete call instead of one Tcl call per row
+            self.tree.delete(*children)
+        self._rows = []
     
     def add_row(self, values: tuple):
         """Add a row to the table"""
-        self.tree.insert('', 'end', values=values)
+        item = self.tree.insert('', 'end', values=values)
+        self._rows.append((values, item))
+        return item
+    
+    def add_rows(self, rows):
+        """Add many rows to the table in one batch"""
+        insert = self.tree.insert
+        self._rows.extend(
+            (values, insert('', 'end', values=values))
+            for values in rows
+        )
 
 class DataServiceMixin:
     """
@@ -41,10 +41,33 @@ SOLID Principles:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Dict, Any, Optional
-from datetime import datetime
+from typing import Tuple, Dict, Any, Optional, Callable
 from date_service import DateService
 
+# Shared statement strings, so sqlite3's per-connection statement cache
+# sees the same SQL text on every booking
+_SQL_INSERT_CUSTOMER = "INSERT INTO customers (name, phone, address) VALUES (?, ?, ?)"
+_SQL_INSERT_BOOKING = (
+    "INSERT INTO bookings (customer_id, room_type, checkin_date, checkout_date, status) "
+    "VALUES (?, ?, ?, ?, 'active')"
+)
+_SQL_INSERT_PAYMENT = (
+    "INSERT INTO payments (booking_id, amount, payment_method, status) "
+    "VALUES (?, ?, 'pending', 'pending')"
+)
+
+# Fields every booking must carry, with the labels used in error messages
+_REQUIRED_LABELS = {
+    'name': 'Name',
+    'phone': 'Phone Number',
+    'address': 'Address',
+    'room_type': 'Room Type',
+    'checkin_date': 'Check-in Date',
+    'checkout_date': 'Check-out Date'
+}
+_REQUIRED_FIELDS = tuple(_REQUIRED_LABELS.items())
+_ROOM_TYPE_PLACEHOLDER = "Select Room Type"
+
 # Observer Pattern
 class BookingObserver(ABC):
     @abstractmethod
@@ -63,18 +86,11 @@ class BookingValidationStrategy(ABC):
 
 class RequiredFieldsValidation(BookingValidationStrategy):
     def validate(self, booking_data: Dict[str, Any]) -> Tuple[bool, str]:
-        required_fields = {
-            'name': 'Name',
-            'phone': 'Phone Number',
-            'address': 'Address',
-            'room_type': 'Room Type'
-        }
-        
-        for field, label in required_fields.items():
+        for field, label in _REQUIRED_FIELDS:
             if not booking_data.get(field):
                 return False, f"{label} is required!"
                 
-        if booking_data['room_type'] == "Select Room Type":
+        if booking_data['room_type'] == _ROOM_TYPE_PLACEHOLDER:
             return False, "Please select a room type!"
             
         return True, ""
@@ -87,11 +103,9 @@ class DateValidation(BookingValidationStrategy):
         if not checkin or not checkout:
             return False, "Check-in and Check-out dates are required!"
             
-        # DateEntry widget returns date objects directly
-        if checkout <= checkin:
-            return False, "Check-out date must be after check-in date!"
-            
-        return True, ""
+        # DateEntry widget returns date objects directly; DateService applies
+        # the ordering, past-date and maximum-stay rules
+        return DateService.validate_dates(checkin, checkout)
 
 # Strategy Pattern - Booking Process Strategies
 class BookingProcessStrategy(ABC):
@@ -102,25 +116,19 @@ class BookingProcessStrategy(ABC):
 class StandardBookingProcess(BookingProcessStrategy):
     def process(self, booking_data: Dict[str, Any], database_service: Any) -> Tuple[bool, str, Any]:
         try:
-            # Save customer data
-            database_service.execute_query(
-                "INSERT INTO Customers (name, phone, address) VALUES (?, ?, ?)",
+            # Save customer data - execute_query returns the new row id
+            customer_id = database_service.execute_query(
+                _SQL_INSERT_CUSTOMER,
                 (booking_data['name'], booking_data['phone'], booking_data['address'])
             )
-            
-            # Get customer ID
-            customer_id = database_service.fetch_query(
-                "SELECT id FROM Customers WHERE name=? AND phone=?",
-                (booking_data['name'], booking_data['phone'])
-            )[0][0]
-            
+
             # Convert dates to strings - the DateEntry widget returns a datetime.date object
-            checkin_str = booking_data['checkin_date'].strftime('%Y-%m-%d')
-            checkout_str = booking_data['checkout_date'].strftime('%Y-%m-%d')
+            checkin_str = DateService.to_string(booking_data['checkin_date'])
+            checkout_str = DateService.to_string(booking_data['checkout_date'])
             
             # Save booking data
             database_service.execute_query(
-                "INSERT INTO Bookings (customer_id, room_type, checkin_date, checkout_date) VALUES (?, ?, ?, ?)",
+                _SQL_INSERT_BOOKING,
                 (
                     customer_id,
                     booking_data['room_type'],
@@ -141,72 +149,80 @@ class BookingService:
     def __init__(self, database_service, room_service):
         self.database_service = database_service
         self.room_service = room_service
-        self.date_service = DateService()
-        self.observers: List[BookingObserver] = []
-        self.validation_strategies: List[BookingValidationStrategy] = [
+        # Bound observer callbacks, resolved once at attach time. Tuples are
+        # replaced rather than mutated, so an observer may detach itself
+        # while being notified
+        self._on_success_cbs: Tuple[Callable[[Dict[str, Any]], None], ...] = ()
+        self._on_error_cbs: Tuple[Callable[[str], None], ...] = ()
+        # Ordered cheapest first; the first failure stops validation
+        self.validation_strategies: Tuple[BookingValidationStrategy, ...] = (
             RequiredFieldsValidation(),
             DateValidation()
-        ]
+        )
         self.booking_strategy: BookingProcessStrategy = StandardBookingProcess()
     
     def attach(self, observer: BookingObserver):
         """Attach an observer"""
-        self.observers.append(observer)
+        self._on_success_cbs += (observer.on_booking_success,)
+        self._on_error_cbs += (observer.on_booking_error,)
     
     def detach(self, observer: BookingObserver):
         """Detach an observer"""
-        self.observers.remove(observer)
+        success_cb = observer.on_booking_success
+        error_cb = observer.on_booking_error
+        self._on_success_cbs = tuple(cb for cb in self._on_success_cbs if cb != success_cb)
+        self._on_error_cbs = tuple(cb for cb in self._on_error_cbs if cb != error_cb)
     
     def notify_success(self, booking_data: Dict[str, Any]):
         """Notify observers of successful booking"""
-        for observer in self.observers:
-            observer.on_booking_success(booking_data)
+        if not self._on_success_cbs:
+            return
+        for callback in self._on_success_cbs:
+            callback(booking_data)
     
     def notify_error(self, error_message: str):
         """Notify observers of booking error"""
-        for observer in self.observers:
-            observer.on_booking_error(error_message)
+        if not self._on_error_cbs:
+            return
+        for callback in self._on_error_cbs:
+            callback(error_message)
     
     def set_booking_strategy(self, strategy: BookingProcessStrategy):
         self.booking_strategy = strategy
     
     def add_validation_strategy(self, strategy: BookingValidationStrategy):
-        self.validation_strategies.append(strategy)
+        self.validation_strategies += (strategy,)
     
     def validate_booking_data(self, booking_data: Dict[str, Any]) -> Optional[str]:
-        """Validate booking data"""
-        required_fields = ['name', 'phone', 'address', 'room_type', 'checkin_date', 'checkout_date']
-        
-        # Check required fields
-        for field in required_fields:
-            if field not in booking_data or not booking_data[field]:
-                return f"{field.replace('_', ' ').title()} is required"
-        
-        # Validate dates
-        is_valid_dates, message = self.date_service.validate_dates(
-            booking_data['checkin_date'],
-            booking_data['checkout_date']
-        )
-        if not is_valid_dates:
-            return message
-        
+        """Run the validation strategies; return the first error, if any"""
+        for validator in self.validation_strategies:
+            is_valid, message = validator.validate(booking_data)
+            if not is_valid:
+                return message
         return None
     
     def process_booking(self, booking_data: Dict[str, Any]):
         """Process a new booking"""
+        self.notify_result(booking_data, self.book(booking_data))
+    
+    def notify_result(self, booking_data: Dict[str, Any], error: Optional[str]):
+        """Notify observers of the outcome returned by book()"""
+        if error:
+            self.notify_error(error)
+        else:
+            self.notify_success(booking_data)
+    
+    def book(self, booking_data: Dict[str, Any]) -> Optional[str]:
+        """
+        Validate and save a booking without notifying observers.
+        Returns an error message, or None on success. Safe to run on the
+        database worker thread.
+        """
         try:
             # Validate booking data
             error = self.validate_booking_data(booking_data)
             if error:
-                self.notify_error(error)
-                return
-            
-            # Run all validation strategies
-            for validator in self.validation_strategies:
-                is_valid, message = validator.validate(booking_data)
-                if not is_valid:
-                    self.notify_error(message)
-                    return
+                return error
             
             # Check room availability
             if not self.room_service.is_room_available(
@@ -214,49 +230,42 @@ class BookingService:
                 booking_data['checkin_date'],
                 booking_data['checkout_date']
             ):
-                self.notify_error("Selected room is not available for these dates!")
-                return
-            
-            # Insert customer
-            customer_id = self.database_service.execute_query(
-                """
-                INSERT INTO customers (name, phone, address)
-                VALUES (?, ?, ?)
-                """,
-                (booking_data['name'], booking_data['phone'], booking_data['address'])
-            )
+                return "Selected room is not available for these dates!"
             
             # Format dates for database
-            checkin_str = self.date_service.to_string(booking_data['checkin_date'])
-            checkout_str = self.date_service.to_string(booking_data['checkout_date'])
-            
-            # Insert booking
-            booking_id = self.database_service.execute_query(
-                """
-                INSERT INTO bookings (customer_id, room_type, checkin_date, checkout_date, status)
-                VALUES (?, ?, ?, ?, 'active')
-                """,
-                (customer_id, booking_data['room_type'], checkin_str, checkout_str)
-            )
-            
+            checkin_str = DateService.to_string(booking_data['checkin_date'])
+            checkout_str = DateService.to_string(booking_data['checkout_date'])
+
             # Calculate bill
             bill_info = self.room_service.calculate_total_bill(
                 booking_data['room_type'],
                 booking_data['checkin_date'],
                 booking_data['checkout_date']
             )
+
+            # Customer, booking and payment are saved in one transaction
+            with self.database_service.transaction() as cursor:
+                # Insert customer
+                cursor.execute(
+                    _SQL_INSERT_CUSTOMER,
+                    (booking_data['name'], booking_data['phone'], booking_data['address'])
+                )
+                customer_id = cursor.lastrowid
+
+                # Insert booking
+                cursor.execute(
+                    _SQL_INSERT_BOOKING,
+                    (customer_id, booking_data['room_type'], checkin_str, checkout_str)
+                )
+                booking_id = cursor.lastrowid
+
+                # Insert payment record
+                cursor.execute(
+                    _SQL_INSERT_PAYMENT,
+                    (booking_id, bill_info['total'])
+                )
             
-            # Insert payment record
-            self.database_service.execute_query(
-                """
-                INSERT INTO payments (booking_id, amount, payment_method, status)
-                VALUES (?, ?, 'pending', 'pending')
-                """,
-                (booking_id, bill_info['total'])
-            )
-            
-            # Notify success
-            self.notify_success(booking_data)
+            return None
             
         except Exception as e:
-            self.notify_error(f"An error occurred: {str(e)}")
+            return f"An error occurred: {str(e)}"
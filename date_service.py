@@ -32,6 +32,37 @@ Handles all date-related operations consistently throughout the application.
 
 from datetime import datetime, date, timedelta
 from typing import Union, Tuple
+import functools
+import re
+import time
+
+# How long date.today() is reused; a booking form never needs finer "today"
+TODAY_TTL_SECONDS = 60
+_today_cache = (0.0, None)
+
+def _today() -> date:
+    """Return today's date, refreshed at most every TODAY_TTL_SECONDS"""
+    global _today_cache
+    timestamp, today = _today_cache
+    now = time.monotonic()
+    if today is None or now - timestamp >= TODAY_TTL_SECONDS:
+        today = date.today()
+        _today_cache = (now, today)
+    return today
+
+# Canonical zero-padded YYYY-MM-DD, ASCII digits only
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+@functools.lru_cache(maxsize=512)
+def _parse_date_cached(date_str: str) -> date:
+    """Parse an ISO date string; a session only sees a handful of distinct dates"""
+    # Validates input only; SQL is always given to_string output instead.
+    # Only canonical YYYY-MM-DD: fromisoformat on 3.11 also takes week dates
+    # (2026-W01-1) and basic forms (20260105), and strptime took unpadded
+    # months and days
+    if not _ISO_DATE_RE.fullmatch(date_str):
+        raise ValueError(f"Not a YYYY-MM-DD date: {date_str}")
+    return date.fromisoformat(date_str)
 
 class DateService:
     """Service for handling date operations consistently"""
@@ -41,15 +72,20 @@ class DateService:
     @staticmethod
     def to_string(date_obj: Union[datetime, date]) -> str:
         """Convert a date or datetime object to string format"""
-        if isinstance(date_obj, (datetime, date)):
-            return date_obj.strftime(DateService.DATE_FORMAT)
+        # date.isoformat() is always zero-padded %04d-%02d-%02d (years 1-9999),
+        # so the output is canonical YYYY-MM-DD by construction and needs no
+        # check here. The SQL compares stored dates as text and relies on it
+        if isinstance(date_obj, datetime):
+            return date_obj.date().isoformat()
+        if isinstance(date_obj, date):
+            return date_obj.isoformat()
         raise ValueError(f"Expected datetime.date or datetime.datetime, got {type(date_obj)}")
     
     @staticmethod
     def parse_date(date_str: str) -> date:
         """Parse a date string into a date object"""
         try:
-            return datetime.strptime(date_str, DateService.DATE_FORMAT).date()
+            return _parse_date_cached(date_str)
         except ValueError as e:
             raise ValueError(f"Invalid date format. Expected YYYY-MM-DD, got: {date_str}")
     
@@ -62,7 +98,7 @@ class DateService:
             checkout_date = checkout.date() if isinstance(checkout, datetime) else checkout
             
             # Get today's date
-            today = date.today()
+            today = _today()
             
             # Check if dates are in the past
             if checkin_date < today:
@@ -32,27 +32,45 @@ Design Patterns and SOLID Principles:
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from tkcalendar import DateEntry
 from database_service import DatabaseService
 from payment_factory import PaymentFactory
 from room_service import RoomService
-from records_service import (
-    RecordsService, RecordsObserver,
-    AllRecordsStrategy, ActiveRecordsStrategy,
-    UpcomingRecordsStrategy, CompletedRecordsStrategy
-)
+from records_service import RecordsService, RecordsObserver, RECORD_MODES
 from booking_service import BookingService, BookingObserver
 from base_window import BaseWindow, BaseFormWindow, BaseTableWindow, DataServiceMixin
 from models import Customer, Booking, Room, Payment
-from datetime import datetime
 import os
 import logging
+import time
+import weakref
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Header clock format; minutes are the finest unit shown
+_TIME_FMT = "%Y-%m-%d %H:%M"
+
+class _MoneyLabels(dict):
+    """
+    Amount -> "$x.xx" text, formatted once per distinct amount. A records
+    load repeats a handful of prices and charges down each column, so rows
+    share the cached strings instead of formatting every cell
+    """
+    def __missing__(self, amount):
+        label = self[amount] = "${:.2f}".format(amount)
+        return label
+
+def configure_logging():
+    """
+    Configure application logging once at startup. Records go to stderr,
+    and also to the file named by HOTEL_LOG_FILE when it is set.
+    """
+    handlers = [logging.StreamHandler()]
+    log_file = os.environ.get('HOTEL_LOG_FILE')
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=handlers
+    )
 
 class HotelManagementApp(tk.Tk):
     """Main application window"""
@@ -65,6 +83,8 @@ class HotelManagementApp(tk.Tk):
         
         self.database_service = database_service
         self.room_service = room_service
+        # Open records windows, refreshed after each booking
+        self.records_windows = weakref.WeakSet()
         self._init_window()
         self._init_styles()
         self._create_widgets()
@@ -78,10 +98,9 @@ class HotelManagementApp(tk.Tk):
     def _init_window(self):
         """Initialize main window"""
         self.title("Hotel Management System")
-        self.geometry("1024x768")
         self.configure(bg='#f0f0f0')
         
-        # Center the window
+        # Size and center the window in a single geometry call
         screen_width = self.winfo_screenwidth()
         screen_height = self.winfo_screenheight()
         x = (screen_width - 1024) // 2
@@ -137,6 +156,35 @@ class HotelManagementApp(tk.Tk):
             'Custom.TFrame',
             background=secondary_color
         )
+        
+        # Main menu card: icon and caption share one label
+        self.style.configure(
+            'MenuCard.TLabel',
+            background=secondary_color,
+            foreground=text_color,
+            font=('Arial', 16, 'bold'),
+            padding=(0, 20),
+            anchor='center',
+            justify='center'
+        )
+        
+        # Room information cards
+        self.style.configure('Card.TFrame', background='#ffffff')
+        self.style.configure(
+            'RoomHeader.TLabel',
+            font=('Arial', 16, 'bold'),
+            foreground='#2c3e50'
+        )
+        self.style.configure(
+            'RoomPrice.TLabel',
+            font=('Arial', 14),
+            foreground='#27ae60'
+        )
+        self.style.configure(
+            'RoomDescription.TLabel',
+            font=('Arial', 11),
+            foreground='#7f8c8d'
+        )
     
     def _create_widgets(self):
         """Create main window widgets"""
@@ -167,13 +215,39 @@ class HotelManagementApp(tk.Tk):
             style='Custom.TLabel'
         )
         self.time_label.grid(row=0, column=1, sticky="e")
+        self._last_time_str = None
+        self._clock_job = None
+        self._clock_paused = False
+        # Stop the clock while the window is minimized
+        self.bind("<Unmap>", self._pause_clock)
+        self.bind("<Map>", self._resume_clock)
         self._update_time()
     
     def _update_time(self):
         """Update the time display"""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.time_label.configure(text=current_time)
-        self.after(1000, self._update_time)
+        current_time = time.strftime(_TIME_FMT)
+        if current_time != self._last_time_str:
+            self.time_label.configure(text=current_time)
+            self._last_time_str = current_time
+        # Wake up just after the next wall-clock minute instead of drifting
+        delay = max(1, 60_000 - int((time.time() * 1000) % 60_000))
+        self._clock_job = self.after(delay, self._update_time)
+    
+    def _pause_clock(self, event):
+        """Cancel the pending clock update when the main window is unmapped"""
+        if event.widget is not self or self._clock_paused:
+            return
+        self._clock_paused = True
+        if self._clock_job is not None:
+            self.after_cancel(self._clock_job)
+            self._clock_job = None
+    
+    def _resume_clock(self, event):
+        """Restart the clock when the main window is shown again"""
+        if event.widget is not self or not self._clock_paused:
+            return
+        self._clock_paused = False
+        self._update_time()
     
     def _create_main_menu(self, container):
         """Create main menu with modern card-style buttons"""
@@ -202,26 +276,19 @@ class HotelManagementApp(tk.Tk):
         card = ttk.Frame(parent, style='Custom.TFrame')
         card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
         
-        # Icon
-        ttk.Label(
-            card,
-            text=icon,
-            style='Custom.TLabel',
-            font=('Arial', 32)
-        ).pack(pady=(20, 10))
-        
-        # Text
-        ttk.Label(
+        # Icon above the caption in a single label
+        label = ttk.Label(
             card,
-            text=text,
-            style='Custom.TLabel',
-            font=('Arial', 12, 'bold')
-        ).pack(pady=(0, 20))
+            text=f"{icon}\n{text}",
+            style='MenuCard.TLabel',
+            takefocus=False
+        )
+        label.pack(expand=True, fill='both')
         
         # Make the entire card clickable
-        for child in card.winfo_children():
-            child.bind('<Button-1>', lambda e, cmd=command: cmd())
-        card.bind('<Button-1>', lambda e, cmd=command: cmd())
+        on_click = lambda e: command()
+        label.bind('<Button-1>', on_click)
+        card.bind('<Button-1>', on_click)
     
     def open_booking(self):
         BookingWindow(self, self.database_service)
@@ -251,6 +318,9 @@ class BookingWindow(BaseFormWindow, DataServiceMixin, BookingObserver):
     
     def _create_widgets(self):
         """Create booking form widgets"""
+        # tkcalendar pulls in babel's locale data; only the booking form needs it
+        from tkcalendar import DateEntry
+        
         self.show_header("New Booking")
         
         # Form fields
@@ -266,7 +336,7 @@ class BookingWindow(BaseFormWindow, DataServiceMixin, BookingObserver):
         # Room selection
         ttk.Label(self.main_frame, text="Room Type:").grid(row=4, column=0, padx=5, pady=5, sticky='e')
         self.room_type = self.create_combobox(
-            [room[0] for room in self.room_service.get_room_types()],
+            self.room_service.get_room_type_names(),
             4, 1
         )
         self.room_type.set("Select Room Type")
@@ -293,7 +363,7 @@ class BookingWindow(BaseFormWindow, DataServiceMixin, BookingObserver):
         self.checkout_date.grid(row=6, column=1, padx=5, pady=5, sticky='w')
         
         # Submit button
-        self.create_button("Submit Booking", self.book_room, 7, 0)
+        self.submit_button = self.create_button("Submit Booking", self.book_room, 7, 0)
     
     def book_room(self):
         """Process booking submission"""
@@ -312,17 +382,24 @@ class BookingWindow(BaseFormWindow, DataServiceMixin, BookingObserver):
             'checkout_date': checkout_date
         }
         
-        # Process booking
-        self.booking_service.process_booking(booking_data)
+        # Process booking on the database worker; observers are notified
+        # back on the Tk thread once it finishes
+        self.submit_button.state(['disabled'])
+        future = self.database_service.submit(self.booking_service.book, booking_data)
+        self.poll_future(future, lambda error: self._on_booking_done(booking_data, error))
+    
+    def _on_booking_done(self, booking_data, error):
+        """Re-enable the form and report the booking outcome"""
+        self.submit_button.state(['!disabled'])
+        self.booking_service.notify_result(booking_data, error)
     
     def on_booking_success(self, booking_data):
         """Handle successful booking"""
         messagebox.showinfo("Success", "Booking has been successfully saved!")
         
         # Refresh records if records window is open
-        for widget in self.root.winfo_children():
-            if isinstance(widget, RecordsWindow):
-                widget.load_records()
+        for records_window in tuple(self.root.records_windows):
+            records_window.load_records()
         
         # Close booking window
         self.destroy()
@@ -344,6 +421,9 @@ class RecordsWindow(BaseTableWindow, DataServiceMixin, RecordsObserver):
         self.records_service = RecordsService(database_service)
         self.records_service.attach(self)
         self.room_service = root.room_service
+        root.records_windows.add(self)
+        # Latest load request; readers run in parallel and may finish out of order
+        self._records_future = None
         
         columns = (
             'ID', 'Customer', 'Room Type', 'Check-in', 'Check-out',
@@ -352,7 +432,7 @@ class RecordsWindow(BaseTableWindow, DataServiceMixin, RecordsObserver):
         BaseTableWindow.__init__(self, root, "Booking Records", columns, "1200x600")
         
         self._create_filter_buttons()
-        self.records_service.load_records()
+        self.load_records()
     
     def _create_filter_buttons(self):
         """Create filter buttons"""
@@ -363,8 +443,9 @@ class RecordsWindow(BaseTableWindow, DataServiceMixin, RecordsObserver):
             ("Completed", "completed")
         ]
         
+        Button = ttk.Button
         for idx, (text, filter_type) in enumerate(filters):
-            ttk.Button(
+            Button(
                 self.button_frame,
                 text=text,
                 command=lambda ft=filter_type: self.change_filter(ft)
@@ -376,46 +457,61 @@ class RecordsWindow(BaseTableWindow, DataServiceMixin, RecordsObserver):
     
     def change_filter(self, filter_type: str):
         """Change records filter"""
-        if filter_type == "all":
-            self.records_service.set_strategy(AllRecordsStrategy())
-        elif filter_type == "active":
-            self.records_service.set_strategy(ActiveRecordsStrategy())
-        elif filter_type == "upcoming":
-            self.records_service.set_strategy(UpcomingRecordsStrategy())
-        elif filter_type == "completed":
-            self.records_service.set_strategy(CompletedRecordsStrategy())
+        if filter_type in RECORD_MODES:
+            self.records_service.set_mode(filter_type)
         
-        self.records_service.load_records()
+        self.load_records()
     
-    def update(self, records):
-        """Update table with new records"""
-        self.clear_table()
-        total_revenue = 0.0
-        
-        for record in records:
-            booking_id, customer, room_type, checkin, checkout, nights, price_per_night, room_charge, tax, service_charge, total, status = record
-            
-            # Format dates for display
-            checkin_str = checkin if isinstance(checkin, str) else checkin.strftime('%Y-%m-%d')
-            checkout_str = checkout if isinstance(checkout, str) else checkout.strftime('%Y-%m-%d')
-            
-            # Add row with billing information
-            self.add_row((
+    def load_records(self):
+        """Reload the table; the query and row formatting run off the Tk thread"""
+        self._records_future = future = self.records_service.load_records_async(self.format_records)
+        self.poll_future(future, lambda result: self._on_records_loaded(future, result))
+    
+    def _on_records_loaded(self, future, result):
+        """Show loaded records unless a newer load has been started since"""
+        if future is self._records_future:
+            self.show_rows(*result)
+    
+    @staticmethod
+    def format_records(records):
+        """Format records into table rows and the revenue total; thread-safe"""
+        # A fresh cache per call keeps this safe on reader threads
+        money = _MoneyLabels().__getitem__
+        rows = []
+        append_row = rows.append
+        
+        for (booking_id, customer, room_type, checkin, checkout, nights, price_per_night,
+             room_charge, tax, service_charge, total, status, _) in records:
+            # Dates arrive as ISO strings from RecordsService
+            append_row((
                 booking_id, customer, room_type,
-                checkin_str, checkout_str,
-                f"{nights:.1f}", f"${price_per_night:.2f}",
-                f"${room_charge:.2f}", f"${tax:.2f}",
-                f"${service_charge:.2f}", f"${total:.2f}",
+                checkin, checkout,
+                nights, money(price_per_night),
+                money(room_charge), money(tax),
+                money(service_charge), money(total),
                 status
             ))
-            
-            total_revenue += total
+        
+        # RecordsService repeats the revenue total of the load on every record
+        total_revenue = records[0][12] if records else 0.0
+        return rows, total_revenue
+    
+    def update(self, records):
+        """Update table with new records"""
+        self.show_rows(*self.format_records(records))
+    
+    def show_rows(self, rows, total_revenue):
+        """Replace the table with already formatted rows"""
+        # Replace the table contents in one batch once all rows are formatted
+        self.clear_table()
+        self.add_rows(rows)
         
         # Update total revenue display
         self.total_label.config(text=f"Total Revenue: ${total_revenue:.2f}")
     
     def destroy(self):
         self.records_service.detach(self)
+        self.master.records_windows.discard(self)
         super().destroy()
 
 class PaymentWindow(tk.Toplevel):
@@ -468,31 +564,39 @@ class PaymentWindow(tk.Toplevel):
         
         # Initialize with empty fields
         self.payment_fields = {}
+        # (label, entry) pairs reused across payment methods; grown on demand
+        self._field_pool = []
     
     def on_payment_method_change(self, event=None):
         """Update form fields when payment method changes"""
-        # Clear existing fields
-        for widget in self.fields_frame.winfo_children():
-            widget.destroy()
         self.payment_fields = {}
         
         # Get selected payment method
         method = self.payment_method.get()
-        if not method:
-            return
+        required_fields = {}
+        if method:
+            # Get processor and its required fields
+            processor = self.payment_factory.get_payment_processor(method)
+            required_fields = processor.get_payment_fields()
         
-        # Get processor and its required fields
-        processor = self.payment_factory.get_payment_processor(method)
-        required_fields = processor.get_payment_fields()
+        # Grow the pool only when a method needs more fields than seen so far
+        pool = self._field_pool
+        while len(pool) < len(required_fields):
+            pool.append((ttk.Label(self.fields_frame), ttk.Entry(self.fields_frame, width=40)))
         
-        # Create fields
+        # Relabel and show the pooled fields this method needs
         for i, (field_id, label) in enumerate(required_fields.items()):
-            ttk.Label(self.fields_frame, text=label + ":").grid(
-                row=i, column=0, padx=5, pady=5, sticky='e'
-            )
-            entry = ttk.Entry(self.fields_frame, width=40)
+            label_widget, entry = pool[i]
+            label_widget.configure(text=label + ":")
+            label_widget.grid(row=i, column=0, padx=5, pady=5, sticky='e')
+            entry.delete(0, tk.END)
             entry.grid(row=i, column=1, padx=5, pady=5, sticky='w')
             self.payment_fields[field_id] = entry
+        
+        # Hide the rest; grid_remove keeps them for the next method
+        for label_widget, entry in pool[len(required_fields):]:
+            label_widget.grid_remove()
+            entry.grid_remove()
     
     def process_payment(self):
         """Process the payment"""
@@ -555,56 +659,40 @@ class RoomsInfoWindow(BaseWindow):
         # Get room information
         room_info = self.room_service.get_room_types()
         
+        # Widget classes resolved once for the per-card loop
+        Frame = ttk.Frame
+        Label = ttk.Label
+        
         # Create a card for each room type
         for idx, (room_type, price, capacity, description) in enumerate(room_info):
             # Create card frame
-            card = ttk.Frame(cards_frame, style='Card.TFrame')
+            card = Frame(cards_frame, style='Card.TFrame')
             card.grid(row=idx, column=0, sticky='ew', padx=10, pady=5)
             
             # Configure card grid
             card.grid_columnconfigure(1, weight=1)
             
             # Room type header
-            ttk.Label(
+            Label(
                 card,
                 text=room_type,
                 style='RoomHeader.TLabel'
             ).grid(row=0, column=0, columnspan=2, sticky='w', padx=10, pady=5)
             
             # Price and Capacity
-            ttk.Label(
+            Label(
                 card,
                 text=f"Price per night: ${price:.2f} | Capacity: {capacity} rooms",
                 style='RoomPrice.TLabel'
             ).grid(row=1, column=0, columnspan=2, sticky='w', padx=10, pady=2)
             
             # Description
-            ttk.Label(
+            Label(
                 card,
                 text=description,
                 style='RoomDescription.TLabel',
                 wraplength=700
             ).grid(row=2, column=0, columnspan=2, sticky='w', padx=10, pady=5)
-    
-    def _configure_styles(self):
-        """Configure custom styles for room cards"""
-        style = ttk.Style()
-        
-        # Card style
-        style.configure('Card.TFrame', background='#ffffff')
-        
-        # Label styles
-        style.configure('RoomHeader.TLabel',
-                       font=('Arial', 16, 'bold'),
-                       foreground='#2c3e50')
-        
-        style.configure('RoomPrice.TLabel',
-                       font=('Arial', 14),
-                       foreground='#27ae60')
-        
-        style.configure('RoomDescription.TLabel',
-                       font=('Arial', 11),
-                       foreground='#7f8c8d')
 
 class RestaurantMenuWindow(tk.Toplevel):
     def __init__(self, root):
@@ -622,7 +710,7 @@ class RestaurantMenuWindow(tk.Toplevel):
             "Burger": 50, "Pizza": 150
         }
         
-        self.selected_items = []
+        self.selected_items = set()
         
         for idx, (item, price) in enumerate(self.items.items(), start=1):
             ttk.Checkbutton(
@@ -637,15 +725,16 @@ class RestaurantMenuWindow(tk.Toplevel):
         
     def toggle_item(self, item):
         if item in self.selected_items:
-            self.selected_items.remove(item)
+            self.selected_items.discard(item)
         else:
-            self.selected_items.append(item)
+            self.selected_items.add(item)
             
     def calculate_bill(self):
         total = sum(self.items[item] for item in self.selected_items)
         messagebox.showinfo("Bill", f"Total Bill: Rs.{total}")
 
 if __name__ == "__main__":
+    configure_logging()
     database_service = DatabaseService()
     room_service = RoomService(database_service)
     app = HotelManagementApp(database_service, room_service)
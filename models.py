@@ -1,8 +1,12 @@
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import date
 from typing import Optional
+import sys
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__; slots=True needs 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class Customer:
     """Customer data model"""
     name: str
@@ -16,34 +20,36 @@ class Customer:
         id_, name, phone, address = data
         return cls(name=name, phone=phone, address=address, id=id_)
 
-@dataclass
+@dataclass(**_SLOTS)
 class Booking:
     """Booking data model"""
     customer_id: int
     room_type: str
-    checkin_date: datetime
-    checkout_date: datetime
+    checkin_date: date
+    checkout_date: date
     id: Optional[int] = None
     status: Optional[str] = None
+    # Length of stay in days, computed once at construction
+    duration: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute booking duration in days"""
+        self.duration = (self.checkout_date - self.checkin_date).days
 
     @classmethod
     def from_db(cls, data: tuple):
         """Create Booking instance from database tuple"""
+        # DATE columns already arrive as date objects via the sqlite3 converter
         id_, customer_id, room_type, checkin, checkout = data
         return cls(
             id=id_,
             customer_id=customer_id,
             room_type=room_type,
-            checkin_date=datetime.strptime(checkin, '%Y-%m-%d'),
-            checkout_date=datetime.strptime(checkout, '%Y-%m-%d')
+            checkin_date=checkin,
+            checkout_date=checkout
         )
 
-    @property
-    def duration(self) -> int:
-        """Calculate booking duration in days"""
-        return (self.checkout_date - self.checkin_date).days
-
-@dataclass
+@dataclass(**_SLOTS)
 class Room:
     """Room data model"""
     room_type: str
@@ -56,7 +62,7 @@ class Room:
         """Check if room is available"""
         return self.current_bookings < self.capacity
 
-@dataclass
+@dataclass(**_SLOTS)
 class Payment:
     """Payment data model"""
     amount: float
@@ -42,7 +42,7 @@ SOLID Principles:
 
 from abc import ABC, abstractmethod
 from tkinter import messagebox
-from typing import Dict
+from typing import Dict, Tuple
 
 class PaymentProcessor(ABC):
     """Abstract base class for payment processing"""
@@ -107,25 +107,27 @@ class UPIProcessor(PaymentProcessor):
             'upi_id': 'UPI ID'
         }
 
+# Processors are stateless, so one shared instance per method is enough
+_PROCESSORS: Dict[str, PaymentProcessor] = {
+    'Credit Card': CreditCardProcessor(),
+    'Debit Card': DebitCardProcessor(),
+    'Cash': CashProcessor(),
+    'UPI': UPIProcessor()
+}
+_METHODS: Tuple[str, ...] = tuple(_PROCESSORS)
+
 class PaymentFactory:
     """Factory class for creating payment processors"""
     
     @staticmethod
     def get_payment_processor(payment_method: str) -> PaymentProcessor:
-        """Create and return a payment processor based on the payment method"""
-        processors = {
-            'Credit Card': CreditCardProcessor(),
-            'Debit Card': DebitCardProcessor(),
-            'Cash': CashProcessor(),
-            'UPI': UPIProcessor()
-        }
-        
-        if payment_method not in processors:
+        """Return the payment processor for the payment method"""
+        try:
+            return _PROCESSORS[payment_method]
+        except KeyError:
             raise ValueError(f"Unsupported payment method: {payment_method}")
-        
-        return processors[payment_method]
     
     @staticmethod
-    def get_available_methods() -> list:
-        """Return list of available payment methods"""
-        return ['Credit Card', 'Debit Card', 'Cash', 'UPI']
\ No newline at end of file
+    def get_available_methods() -> Tuple[str, ...]:
+        """Return the available payment methods"""
+        return _METHODS
\ No newline at end of file
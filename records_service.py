@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Any
-from datetime import datetime
+from concurrent.futures import Future
+from typing import List, Tuple, Dict, Any, Optional, Callable
+from datetime import date
+import logging
+from room_service import TAX_RATE, SERVICE_CHARGE_RATE
+
+logger = logging.getLogger(__name__)
 
 # Observer Pattern - Interface for observers
 class RecordsObserver(ABC):
@@ -8,113 +13,101 @@ class RecordsObserver(ABC):
     def update(self, records: List[Tuple]):
         pass
 
-# Strategy Pattern - Interface for different record loading strategies
-class RecordLoadStrategy(ABC):
-    @abstractmethod
-    def load(self, database_service) -> List[Tuple]:
-        pass
-
-# Concrete Strategies
-class AllRecordsStrategy(RecordLoadStrategy):
-    def load(self, database_service) -> List[Tuple]:
-        return database_service.fetch_query("""
-            SELECT 
-                b.id, 
-                c.name, 
-                b.room_type, 
-                b.checkin_date, 
-                b.checkout_date,
-                julianday(b.checkout_date) - julianday(b.checkin_date) as nights,
-                rt.price as price_per_night,
-                (julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price as room_charge,
-                ((julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price) * 0.18 as tax,
-                ((julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price) * 0.10 as service_charge,
-                ((julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price) * 1.28 as total,
-                b.status
-            FROM bookings b
-            JOIN customers c ON b.customer_id = c.id
-            JOIN room_types rt ON b.room_type = rt.room_type
-            ORDER BY b.checkin_date DESC
-        """)
-
-class ActiveRecordsStrategy(RecordLoadStrategy):
-    def load(self, database_service) -> List[Tuple]:
-        return database_service.fetch_query("""
-            SELECT 
-                b.id, 
-                c.name, 
-                b.room_type, 
-                b.checkin_date, 
-                b.checkout_date,
-                julianday(b.checkout_date) - julianday(b.checkin_date) as nights,
-                rt.price as price_per_night,
-                (julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price as room_charge,
-                ((julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price) * 0.18 as tax,
-                ((julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price) * 0.10 as service_charge,
-                ((julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price) * 1.28 as total,
-                'Active' as status
-            FROM bookings b
-            JOIN customers c ON b.customer_id = c.id
-            JOIN room_types rt ON b.room_type = rt.room_type
-            WHERE b.status = 'active'
-            AND date('now') BETWEEN b.checkin_date AND b.checkout_date
-            ORDER BY b.checkin_date DESC
-        """)
+# Template for the records query; each mode in RECORD_MODES fills in its
+# WHERE clause once at import, so every filter has one fixed statement text
+# that each connection's statement cache compiles a single time. Today's date is bound
+# as :today rather than computed with date('now'), so the date filters are
+# plain column comparisons SQLite can seek on idx_bookings_checkin.
+# LIMIT -1 OFFSET 0 stops SQLite from flattening the CTE, after the filter
+# has been applied, so the revenue sum reuses each row's nights instead of
+# evaluating julianday() again. The charges are not computed in SQL:
+# _with_charges derives them from nights and price with room_service's rates,
+# which is also cheaper than sqlite3 building four more float objects per row. :period is None for all records, otherwise the period
+# label the filtered rows are shown with
+_RECORDS_SQL = """
+    WITH stays AS (
+        SELECT 
+            bb.id, 
+            c.name, 
+            bb.room_type, 
+            CAST(bb.checkin_date AS TEXT) as checkin_date, 
+            CAST(bb.checkout_date AS TEXT) as checkout_date,
+            bb.nights,
+            bb.price_per_night,
+            bb.status
+        FROM booking_bills bb
+        JOIN customers c ON bb.customer_id = c.id
+        WHERE {where}
+        LIMIT -1 OFFSET 0
+    )
+    SELECT 
+        id, 
+        name, 
+        room_type, 
+        checkin_date, 
+        checkout_date,
+        nights,
+        price_per_night,
+        COALESCE(:period, status) as status,
+        SUM(nights * price_per_night) OVER () as room_revenue
+    FROM stays
+    ORDER BY checkin_date DESC
+"""
 
-class UpcomingRecordsStrategy(RecordLoadStrategy):
-    def load(self, database_service) -> List[Tuple]:
-        return database_service.fetch_query("""
-            SELECT 
-                b.id, 
-                c.name, 
-                b.room_type, 
-                b.checkin_date, 
-                b.checkout_date,
-                julianday(b.checkout_date) - julianday(b.checkin_date) as nights,
-                rt.price as price_per_night,
-                (julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price as room_charge,
-                ((julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price) * 0.18 as tax,
-                ((julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price) * 0.10 as service_charge,
-                ((julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price) * 1.28 as total,
-                'Upcoming' as status
-            FROM bookings b
-            JOIN customers c ON b.customer_id = c.id
-            JOIN room_types rt ON b.room_type = rt.room_type
-            WHERE b.status = 'active'
-            AND date('now') < b.checkin_date
-            ORDER BY b.checkin_date DESC
-        """)
+def _with_charges(rows: List[Tuple]) -> List[Tuple]:
+    """
+    Expand records query rows into full records, adding room charge, tax,
+    service charge and total the way RoomService.calculate_total_bill does,
+    and the revenue total of the load in the last column
+    """
+    if not rows:
+        return []
+    # Every row carries the same room revenue, so the total is taxed once
+    room_revenue = rows[0][-1]
+    total_revenue = (
+        room_revenue + room_revenue * TAX_RATE + room_revenue * SERVICE_CHARGE_RATE
+    )
+    records = []
+    append = records.append
+    for booking_id, name, room_type, checkin, checkout, nights, price, status, _ in rows:
+        room_charge = price * nights
+        tax = room_charge * TAX_RATE
+        service_charge = room_charge * SERVICE_CHARGE_RATE
+        append((
+            booking_id, name, room_type, checkin, checkout, nights, price,
+            room_charge, tax, service_charge, room_charge + tax + service_charge,
+            status, total_revenue
+        ))
+    return records
 
-class CompletedRecordsStrategy(RecordLoadStrategy):
-    def load(self, database_service) -> List[Tuple]:
-        return database_service.fetch_query("""
-            SELECT 
-                b.id, 
-                c.name, 
-                b.room_type, 
-                b.checkin_date, 
-                b.checkout_date,
-                julianday(b.checkout_date) - julianday(b.checkin_date) as nights,
-                rt.price as price_per_night,
-                (julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price as room_charge,
-                ((julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price) * 0.18 as tax,
-                ((julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price) * 0.10 as service_charge,
-                ((julianday(b.checkout_date) - julianday(b.checkin_date)) * rt.price) * 1.28 as total,
-                'Completed' as status
-            FROM bookings b
-            JOIN customers c ON b.customer_id = c.id
-            JOIN room_types rt ON b.room_type = rt.room_type
-            WHERE b.status = 'active'
-            AND date('now') > b.checkout_date
-            ORDER BY b.checkin_date DESC
-        """)
+# Filter keys accepted by RecordsService.set_mode, each mapped to its records
+# statement and the period label its rows are shown with. Only active
+# bookings have a period; a stay is active from its checkin day through its
+# checkout day
+RECORD_MODES: Dict[str, Tuple[str, Optional[str]]] = {
+    "all": (_RECORDS_SQL.format(where="1"), None),
+    "active": (
+        _RECORDS_SQL.format(
+            where="bb.status = 'active' AND bb.checkin_date <= :today AND bb.checkout_date >= :today"
+        ),
+        'Active'
+    ),
+    "upcoming": (
+        _RECORDS_SQL.format(where="bb.status = 'active' AND bb.checkin_date > :today"),
+        'Upcoming'
+    ),
+    "completed": (
+        _RECORDS_SQL.format(where="bb.status = 'active' AND bb.checkout_date < :today"),
+        'Completed'
+    )
+}
 
 # Records Service implementing Observer pattern
 class RecordsService:
     def __init__(self, database_service):
         self.database_service = database_service
         self.observers = []
-        self.strategy = AllRecordsStrategy()
+        self.mode = "all"
     
     def attach(self, observer: RecordsObserver):
         self.observers.append(observer)
@@ -126,14 +119,35 @@ class RecordsService:
         for observer in self.observers:
             observer.update(records)
     
-    def set_strategy(self, strategy: RecordLoadStrategy):
-        self.strategy = strategy
-        self.load_records()
+    def set_mode(self, mode: str):
+        """Select the records filter by key: all, active, upcoming or completed"""
+        # Callers reload explicitly, usually through load_records_async
+        if mode not in RECORD_MODES:
+            raise ValueError(f"Unknown records mode: {mode}")
+        self.mode = mode
     
-    def load_records(self):
+    def fetch_records(self, mode: Optional[str] = None) -> List[Tuple]:
+        """Load records without notifying; safe on the database worker thread"""
         try:
-            records = self.strategy.load(self.database_service)
-            self.notify(records if records else [])
+            sql, period = RECORD_MODES[mode or self.mode]
+            # Local date, read per load so a window left open rolls over at midnight
+            rows = self.database_service.fetch_query(
+                sql, {'period': period, 'today': date.today().isoformat()}
+            )
+            return _with_charges(rows)
         except Exception as e:
-            print(f"Error loading records: {str(e)}")
-            self.notify([])
+            logger.exception(f"Error loading records: {e}")
+            return []
+    
+    def load_records(self):
+        self.notify(self.fetch_records())
+    
+    def load_records_async(self, prepare: Optional[Callable[[List[Tuple]], Any]] = None) -> Future:
+        """
+        Fetch records in the current mode on a database reader thread.
+        prepare, if given, also runs there and its result becomes the future's
+        """
+        mode = self.mode
+        if prepare is None:
+            return self.database_service.submit_read(self.fetch_records, mode)
+        return self.database_service.submit_read(lambda: prepare(self.fetch_records(mode)))
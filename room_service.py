@@ -47,6 +47,45 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Bill rates, applied to the room charge. The single source for every bill:
+# calculate_total_bill and the records loader both read these
+TAX_RATE = 0.18
+SERVICE_CHARGE_RATE = 0.10
+
+# SQL used by RoomService. Keep these as plain constants, never f-strings:
+# sqlite3's per-connection statement cache (cached_statements in
+# DatabaseService) is keyed by the SQL text, so identical text is parsed and
+# planned once per connection. Values always go in as ? parameters
+_SQL_CREATE_ROOM_TYPES = """
+    CREATE TABLE IF NOT EXISTS room_types (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        room_type TEXT UNIQUE NOT NULL,
+        price REAL NOT NULL,
+        capacity INTEGER DEFAULT 20,
+        description TEXT
+    )
+"""
+_SQL_INSERT_ROOM_TYPE = """
+    INSERT INTO room_types (room_type, price, capacity, description)
+    VALUES (?, ?, ?, ?)
+"""
+# Stays overlap when each starts before the other ends; the checkout day
+# itself is free. Dates are stored as ISO text, so they compare correctly
+# without date() and can use idx_bookings_avail. A room type is available
+# while no capacity-th overlapping booking exists, so SQLite answers 1 or 0
+# and stops scanning as soon as that row is found
+_SQL_IS_AVAILABLE = """
+    SELECT NOT EXISTS (
+        SELECT 1
+        FROM bookings
+        WHERE room_type = ?
+        AND status = 'active'
+        AND checkin_date < ?
+        AND checkout_date > ?
+        LIMIT 1 OFFSET ?
+    ) as is_available
+"""
+
 class RoomService:
     def __init__(self, database_service):
         """
@@ -55,7 +94,6 @@ class RoomService:
         # Depends on database_service abstraction rather than concrete implementation
         """
         self.database_service = database_service
-        self.date_service = DateService()
         self._init_database()
     
     def _init_database(self):
@@ -66,17 +104,7 @@ class RoomService:
         """
         try:
             # Create room types table
-            self.database_service.execute_query(
-                """
-                CREATE TABLE IF NOT EXISTS room_types (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    room_type TEXT UNIQUE NOT NULL,
-                    price REAL NOT NULL,
-                    capacity INTEGER DEFAULT 20,
-                    description TEXT
-                )
-                """
-            )
+            self.database_service.execute_query(_SQL_CREATE_ROOM_TYPES)
             
             # Insert default room types if table is empty
             if not self.get_room_types():
@@ -87,14 +115,9 @@ class RoomService:
                     ('Family', 4000, 5, 'Large room ideal for families')
                 ]
                 
-                for room in default_rooms:
-                    self.database_service.execute_query(
-                        """
-                        INSERT INTO room_types (room_type, price, capacity, description)
-                        VALUES (?, ?, ?, ?)
-                        """,
-                        room
-                    )
+                # One prepared statement and a single commit for all rows
+                self.database_service.execute_many(_SQL_INSERT_ROOM_TYPE, default_rooms)
+                self.invalidate_room_types()
         except Exception as e:
             logger.error(f"Error initializing database: {str(e)}")
             raise
@@ -105,14 +128,32 @@ class RoomService:
         # SOLID Principle: Single Responsibility Principle (SRP)
         # Handles only room type data retrieval
         """
+        # DatabaseService keeps the one in-memory copy of room_types
+        return list(self.database_service.get_room_types().values())
+    
+    def get_room_type_names(self) -> Tuple[str, ...]:
+        """Names of all room types, for combobox values"""
+        return tuple(self.database_service.get_room_types())
+    
+    def invalidate_room_types(self):
+        """Reload cached room types after the room_types table changes"""
+        self.database_service.reload_room_types()
+    
+    def get_room_info(self, room_type: str) -> Tuple[float, int]:
+        """
+        # Design Pattern: Service Pattern
+        # SOLID Principle: Interface Segregation Principle (ISP)
+        # Price and capacity of a room type in one lookup
+        """
         try:
-            result = self.database_service.fetch_query(
-                "SELECT room_type, price, capacity, description FROM room_types"
-            )
-            return result if result else []
+            entry = self.database_service.get_room_types().get(room_type)
+            if entry is None:
+                logger.error(f"No room info found for room type: {room_type}")
+                raise ValueError(f"Invalid room type: {room_type}")
+            return float(entry[1]), int(entry[2])
         except Exception as e:
-            logger.error(f"Error fetching room types: {str(e)}")
-            return []
+            logger.error(f"Error fetching room info: {str(e)}")
+            raise
     
     def get_room_price(self, room_type: str) -> float:
         """
@@ -120,18 +161,7 @@ class RoomService:
         # SOLID Principle: Open/Closed Principle (OCP)
         # New pricing strategies can be added without modifying this method
         """
-        try:
-            result = self.database_service.fetch_query(
-                "SELECT price FROM room_types WHERE room_type = ?",
-                (room_type,)
-            )
-            if not result or not result[0]:
-                logger.error(f"No price found for room type: {room_type}")
-                raise ValueError(f"Invalid room type: {room_type}")
-            return float(result[0][0])
-        except Exception as e:
-            logger.error(f"Error fetching room price: {str(e)}")
-            raise
+        return self.get_room_info(room_type)[0]
     
     def get_room_capacity(self, room_type: str) -> int:
         """
@@ -139,18 +169,7 @@ class RoomService:
         # SOLID Principle: Interface Segregation Principle (ISP)
         # Provides specific interface for capacity queries
         """
-        try:
-            result = self.database_service.fetch_query(
-                "SELECT capacity FROM room_types WHERE room_type = ?",
-                (room_type,)
-            )
-            if not result or not result[0]:
-                logger.error(f"No capacity found for room type: {room_type}")
-                raise ValueError(f"Invalid room type: {room_type}")
-            return int(result[0][0])
-        except Exception as e:
-            logger.error(f"Error fetching room capacity: {str(e)}")
-            raise
+        return self.get_room_info(room_type)[1]
     
     def is_room_available(self, room_type: str, checkin_date: Union[datetime, date], checkout_date: Union[datetime, date]) -> bool:
         """
@@ -160,44 +179,34 @@ class RoomService:
         """
         try:
             # Convert dates to strings for database query
-            checkin_str = self.date_service.to_string(checkin_date)
-            checkout_str = self.date_service.to_string(checkout_date)
+            checkin_str = DateService.to_string(checkin_date)
+            checkout_str = DateService.to_string(checkout_date)
             
-            valid, error_msg = self.date_service.validate_dates(checkin_date, checkout_date)
+            valid, error_msg = DateService.validate_dates(checkin_date, checkout_date)
             if not valid:
                 logger.error(f"Date validation failed: {error_msg}")
                 return False
             
             # Get room capacity
-            capacity = self.get_room_capacity(room_type)
+            _, capacity = self.get_room_info(room_type)
+            # SQLite reads a negative OFFSET as zero, so handle no capacity here
+            if capacity <= 0:
+                logger.info(f"Room {room_type} has no capacity")
+                return False
             
-            # Get number of active bookings for these dates
-            overlapping_bookings = self.database_service.fetch_query(
-                """
-                SELECT COUNT(*) as booking_count
-                FROM bookings
-                WHERE room_type = ?
-                AND status = 'active'
-                AND (
-                    (date(checkin_date) <= date(?) AND date(checkout_date) > date(?))  -- Booking starts before checkin and ends after checkin
-                    OR (date(checkin_date) < date(?) AND date(checkout_date) >= date(?))  -- Booking starts before checkout and ends after checkout
-                    OR (date(checkin_date) >= date(?) AND date(checkout_date) <= date(?))  -- Booking is completely within the requested period
-                )
-                """,
-                (room_type, checkin_str, checkin_str, checkout_str, checkout_str, checkin_str, checkout_str)
+            # Room is available if fewer than capacity active bookings overlap
+            result = self.database_service.fetch_one(
+                _SQL_IS_AVAILABLE,
+                (room_type, checkout_str, checkin_str, capacity - 1)
             )
             
-            if not overlapping_bookings:
-                logger.error("Failed to fetch overlapping bookings")
+            if result is None:
+                logger.error("Failed to check overlapping bookings")
                 return False
             
-            current_bookings = int(overlapping_bookings[0][0])
-            logger.info(f"Found {current_bookings} overlapping bookings for {room_type} between {checkin_str} and {checkout_str}")
-            
-            # Room is available if number of current bookings is less than capacity
-            is_available = current_bookings < capacity
+            is_available = bool(result[0])
             if not is_available:
-                logger.info(f"Room {room_type} is fully booked ({current_bookings}/{capacity})")
+                logger.info(f"Room {room_type} is fully booked ({capacity} overlapping bookings) between {checkin_str} and {checkout_str}")
             
             return is_available
             
@@ -208,16 +217,16 @@ class RoomService:
     def calculate_total_bill(self, room_type: str, checkin_date: date, checkout_date: date) -> Dict[str, float]:
         """Calculate total bill for a booking"""
         try:
-            # Get room price
-            price_per_night = self.get_room_price(room_type)
+            # Get room price from the in-memory room type cache
+            price_per_night, _ = self.get_room_info(room_type)
             
             # Calculate number of nights
             nights = (checkout_date - checkin_date).days
             
             # Calculate charges
             room_charge = price_per_night * nights
-            tax = room_charge * 0.18  # 18% tax
-            service_charge = room_charge * 0.10  # 10% service charge
+            tax = room_charge * TAX_RATE
+            service_charge = room_charge * SERVICE_CHARGE_RATE
             total = room_charge + tax + service_charge
             
             return {
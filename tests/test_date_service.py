@@ -0,0 +1,41 @@
+import os
+import sys
+import unittest
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from date_service import DateService
+
+
+class ParseDateTest(unittest.TestCase):
+    def test_accepts_canonical_iso_date(self):
+        self.assertEqual(DateService.parse_date('2026-01-05'), date(2026, 1, 5))
+    
+    def test_rejects_week_date(self):
+        with self.assertRaises(ValueError):
+            DateService.parse_date('2026-W01-1')
+    
+    def test_rejects_trailing_junk(self):
+        with self.assertRaises(ValueError):
+            DateService.parse_date('20260105xx')
+    
+    def test_rejects_unpadded_date(self):
+        with self.assertRaises(ValueError):
+            DateService.parse_date('2026-1-5')
+
+
+
+class ToStringTest(unittest.TestCase):
+    def test_zero_pads_date(self):
+        self.assertEqual(DateService.to_string(date(2026, 1, 5)), '2026-01-05')
+    
+    def test_zero_pads_early_year(self):
+        self.assertEqual(DateService.to_string(date(999, 12, 31)), '0999-12-31')
+    
+    def test_drops_time_of_datetime(self):
+        self.assertEqual(DateService.to_string(datetime(2026, 1, 5, 23, 59)), '2026-01-05')
+
+
+if __name__ == '__main__':
+    unittest.main()